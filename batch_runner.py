@@ -0,0 +1,197 @@
+"""
+Sharded batch runner for the tool-enhanced reasoning system.
+Splits a dataset of queries across worker processes, each running a pool of
+threads on its own client, sharing an on-disk API response cache, and merges
+the results into one file.
+
+Usage:
+    python batch_runner.py queries.jsonl results.json --workers 4 --threads-per-worker 8 --cache-dir .cache
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+def load_queries(input_path: str) -> List[str]:
+    """
+    Load queries from a file.
+
+    Args:
+        input_path: Path to a .jsonl file (objects with a "query" field or
+            plain strings) or a text file with one query per line
+
+    Returns:
+        List of queries in file order (objects without a "query" field are
+        skipped with a warning)
+    """
+    queries = []
+    with open(input_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if input_path.endswith(".jsonl"):
+                item = json.loads(line)
+                if isinstance(item, dict):
+                    if "query" not in item:
+                        print(f"Warning: skipping {input_path}:{line_number}: no \"query\" field")
+                        continue
+                    item = item["query"]
+                queries.append(item)
+            else:
+                queries.append(line)
+    return queries
+
+def split_shards(queries: List[str], num_shards: int) -> List[List[Tuple[int, str]]]:
+    """
+    Split queries into shards round-robin, keeping each query's original index.
+
+    Args:
+        queries: List of queries
+        num_shards: Number of shards
+
+    Returns:
+        List of shards, each a list of (index, query) pairs
+    """
+    shards = [[] for _ in range(num_shards)]
+    for i, query in enumerate(queries):
+        shards[i % num_shards].append((i, query))
+    return [shard for shard in shards if shard]
+
+def run_shard(shard: List[Tuple[int, str]], cache_dir: Optional[str], threads: int = 1, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Process one shard in a worker process.
+
+    Args:
+        shard: List of (index, query) pairs
+        cache_dir: Shared on-disk cache directory (disabled if None)
+        threads: Number of queries processed concurrently on the worker's client
+        verbose: Keep the per-step output of the reasoning system
+
+    Returns:
+        Dictionary with per-query results and shard metrics
+    """
+    from main import ToolEnhancedReasoning
+
+    reasoning_system = ToolEnhancedReasoning(cache_dir=cache_dir)
+
+    def process(item):
+        index, query = item
+        query_start = time.perf_counter()
+        try:
+            result = reasoning_system.process_query(query)
+            error = None
+        except Exception as e:
+            result = None
+            error = str(e)
+        return {
+            "index": index,
+            "query": query,
+            "result": result,
+            "error": error,
+            "elapsed": time.perf_counter() - query_start
+        }
+
+    start = time.perf_counter()
+    # redirect_stdout swaps sys.stdout for the whole process, so it also
+    # silences the worker threads
+    with contextlib.ExitStack() as stack:
+        if not verbose:
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+            results = list(executor.map(process, shard))
+
+    cache = reasoning_system.cache
+    return {
+        "results": results,
+        "metrics": {
+            "pid": os.getpid(),
+            "queries": len(shard),
+            "errors": sum(1 for result in results if result["error"] is not None),
+            "api_failures": reasoning_system.api_failures,
+            "elapsed": time.perf_counter() - start,
+            "cache_hits": cache.hits if cache else 0,
+            "cache_misses": cache.misses if cache else 0
+        }
+    }
+
+def run_sharded(queries: List[str], workers: int, cache_dir: Optional[str] = None, threads_per_worker: int = 1, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Run queries across worker processes and merge their outputs.
+
+    Args:
+        queries: List of queries
+        workers: Number of worker processes
+        cache_dir: Shared on-disk cache directory (disabled if None)
+        threads_per_worker: Number of queries each worker processes concurrently
+        verbose: Keep the per-step output of the reasoning system
+
+    Returns:
+        Dictionary with results in input order and merged metrics
+    """
+    shards = split_shards(queries, max(1, workers))
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max(1, len(shards))) as executor:
+        futures = [executor.submit(run_shard, shard, cache_dir, threads_per_worker, verbose) for shard in shards]
+        shard_outputs = [future.result() for future in futures]
+
+    wall_time = time.perf_counter() - start
+    results = sorted(
+        (result for output in shard_outputs for result in output["results"]),
+        key=lambda result: result["index"]
+    )
+    shard_metrics = [output["metrics"] for output in shard_outputs]
+
+    return {
+        "results": results,
+        "metrics": {
+            "workers": len(shards),
+            "queries": len(results),
+            "errors": sum(m["errors"] for m in shard_metrics),
+            "api_failures": sum(m["api_failures"] for m in shard_metrics),
+            "wall_time": wall_time,
+            "queries_per_second": len(results) / wall_time if wall_time > 0 else 0.0,
+            "cache_hits": sum(m["cache_hits"] for m in shard_metrics),
+            "cache_misses": sum(m["cache_misses"] for m in shard_metrics),
+            "shards": shard_metrics
+        }
+    }
+
+def main():
+    """Run a dataset of queries through sharded worker processes."""
+    parser = argparse.ArgumentParser(description="Sharded batch runner for tool-enhanced reasoning")
+    parser.add_argument("input", help="Queries file (.jsonl or one query per line)")
+    parser.add_argument("output", help="Path of the merged JSON result file")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    parser.add_argument("--threads-per-worker", type=int, default=4, help="Queries processed concurrently in each worker")
+    parser.add_argument("--cache-dir", default=None, help="Shared on-disk API response cache directory")
+    parser.add_argument("--verbose", action="store_true", help="Show per-step output from workers")
+    args = parser.parse_args()
+
+    queries = load_queries(args.input)
+    if not queries:
+        print(f"No queries found in {args.input}")
+        sys.exit(1)
+
+    output = run_sharded(queries, args.workers, args.cache_dir, args.threads_per_worker, args.verbose)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, default=str)
+
+    metrics = output["metrics"]
+    print(f"Processed {metrics['queries']} queries with {metrics['workers']} workers in {metrics['wall_time']:.2f}s")
+    print(f"Throughput: {metrics['queries_per_second']:.2f} queries/s")
+    print(f"Errors: {metrics['errors']}")
+    print(f"API failures: {metrics['api_failures']}")
+    print(f"Cache: {metrics['cache_hits']} hits, {metrics['cache_misses']} misses")
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
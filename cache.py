@@ -0,0 +1,86 @@
+"""
+On-disk cache for API responses.
+Each entry is a separate JSON file written atomically, so several processes can share one cache directory.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Any, Optional
+
+def _to_jsonable(obj: Any) -> Any:
+    """Convert API objects (e.g. assistant messages) to plain data for hashing."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+class DiskCache:
+    """Process-safe key/value cache stored as one JSON file per entry."""
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store entries in (created if missing)
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        # Counters are updated from the speculative and per-worker thread pools
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, namespace: str, key: Any) -> str:
+        """Return the file path for a key."""
+        serialized = json.dumps(key, sort_keys=True, default=_to_jsonable)
+        digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, namespace, digest[:2], f"{digest}.json")
+
+    def get(self, namespace: str, key: Any) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            namespace: Cache namespace (e.g. "responses")
+            key: JSON-serializable key
+
+        Returns:
+            Cached value, or None if missing or unreadable
+        """
+        try:
+            with open(self._path(namespace, key), "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, namespace: str, key: Any, value: Any) -> None:
+        """
+        Store a value, replacing any existing entry atomically.
+
+        Args:
+            namespace: Cache namespace (e.g. "responses")
+            key: JSON-serializable key
+            value: JSON-serializable value
+        """
+        path = self._path(namespace, key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temp file in the same directory, then rename, so readers in
+        # other processes never see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -3,6 +3,23 @@ Function specifications for the tool-enhanced reasoning system.
 This file contains the tool definitions that will be passed to the OpenAI API.
 """
 
+import copy
+
+# Tools whose result is a number (or list of numbers) that a later step may consume
+NUMERIC_RESULT_TOOLS = frozenset([
+    "calculate_average",
+    "calculate_square_root",
+    "add_numbers",
+    "multiply_numbers",
+    "count_vowels",
+    "count_letters",
+    "count_words",
+    "extract_numbers",
+])
+
+# Extra argument added to tools for speculative calls, stripped before execution
+FROM_QUERY_ONLY = "from_query_only"
+
 def get_math_tools():
     """Return mathematical tool specifications."""
     return [
@@ -194,6 +211,54 @@ def get_string_tools():
         }
     ]
 
+_ALL_TOOLS = None
+
 def get_all_tools():
-    """Return all available tool specifications."""
-    return get_math_tools() + get_string_tools() 
\ No newline at end of file
+    """
+    Return all available tool specifications.
+    
+    The specs are built once per process and a new list is returned on each
+    call. The spec dicts themselves are shared and must not be modified;
+    deep-copy one before changing it.
+    """
+    global _ALL_TOOLS
+    if _ALL_TOOLS is None:
+        _ALL_TOOLS = tuple(get_math_tools() + get_string_tools())
+    return list(_ALL_TOOLS)
+
+def get_tool_spec(tool_name):
+    """Return the specification of a single tool, or None if unknown."""
+    for tool in get_all_tools():
+        if tool["function"]["name"] == tool_name:
+            return tool
+    return None
+
+def has_numeric_arguments(tool_name):
+    """Return True if any argument of the tool is a number or list of numbers."""
+    tool = get_tool_spec(tool_name)
+    if tool is None:
+        return False
+    for prop in tool["function"]["parameters"]["properties"].values():
+        if prop["type"] == "number" or prop.get("items", {}).get("type") == "number":
+            return True
+    return False
+
+def get_speculative_tool(tool_name):
+    """
+    Return a tool specification for a speculative argument call.
+    
+    The copy has an extra required flag the model sets to true only when every
+    argument comes from the query and none depends on an earlier step's result.
+    Returns None for unknown tools.
+    """
+    tool = get_tool_spec(tool_name)
+    if tool is None:
+        return None
+    tool = copy.deepcopy(tool)
+    parameters = tool["function"]["parameters"]
+    parameters["properties"][FROM_QUERY_ONLY] = {
+        "type": "boolean",
+        "description": "True only if every argument is taken directly from the user's question and none depends on the result of an earlier step"
+    }
+    parameters["required"] = parameters["required"] + [FROM_QUERY_ONLY]
+    return tool
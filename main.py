@@ -1,40 +1,105 @@
+import time
+_IMPORT_START = time.perf_counter()
+
 import os
+import re
 import json
-from typing import Dict, Any, List
-from dotenv import load_dotenv
-from openai import OpenAI
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
-from tools.math_tools import MathTools
-from tools.string_tools import StringTools
-from function_specs import get_all_tools
+from function_specs import (
+    get_all_tools, get_speculative_tool, has_numeric_arguments,
+    NUMERIC_RESULT_TOOLS, FROM_QUERY_ONLY
+)
+from prompts import PLANNING_PROMPT, EXECUTION_PROMPT, FINAL_ANSWER_PROMPT
 
-# Load environment variables
-load_dotenv()
+_IMPORT_END = time.perf_counter()
 
 class ToolEnhancedReasoning:
-    def __init__(self):
-        """Initialize the reasoning system with tools."""
-        self.math_tools = MathTools()
-        self.string_tools = StringTools()
+    def __init__(self, speculative: bool = True, cache_dir: Optional[str] = None):
+        """
+        Initialize the reasoning system with tools.
+        
+        The OpenAI client and tool modules are imported on first use so that
+        short-lived invocations do not pay for them up front.
+        
+        Args:
+            speculative: Issue argument calls for all planned steps up front
+            cache_dir: Directory for an on-disk API response cache (disabled if None)
+        """
+        # Load environment variables
+        from dotenv import load_dotenv
+        load_dotenv()
+        
+        self._math_tools = None
+        self._string_tools = None
+        self._client = None
+        self._client_lock = threading.Lock()
+        self.api_failures = 0
+        self._failures_lock = threading.Lock()
+        self.speculative = speculative
+        self.cache = None
+        if cache_dir:
+            from cache import DiskCache
+            self.cache = DiskCache(cache_dir)
         self.api_key = os.getenv('OPENAI_API_KEY')
         
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
     
+    @property
+    def math_tools(self):
+        """Math tools, imported on first use."""
+        if self._math_tools is None:
+            from tools.math_tools import MathTools
+            self._math_tools = MathTools()
+        return self._math_tools
+    
+    @property
+    def string_tools(self):
+        """String tools, imported on first use."""
+        if self._string_tools is None:
+            from tools.string_tools import StringTools
+            self._string_tools = StringTools()
+        return self._string_tools
+    
+    @property
+    def client(self):
+        """OpenAI client, imported and created on first use."""
+        if self._client is None:
+            # Speculative argument calls may reach here from several threads
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(api_key=self.api_key)
+        return self._client
+    
     def chat_completion_request(self, messages, tools=None, tool_choice=None, model="gpt-4o-mini"):
         """Make a request to the Chat Completions API."""
+        if self.cache is not None:
+            key = {"model": model, "messages": messages, "tools": tools, "tool_choice": tool_choice}
+            cached = self.cache.get("responses", key)
+            if cached is not None:
+                from openai.types.chat import ChatCompletion
+                return ChatCompletion.model_validate(cached)
+        
         try:
-            client = OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
+            response = self.client.chat.completions.create(
                 model=model,
                 messages=messages,
                 tools=tools,
                 tool_choice=tool_choice,
             )
-            return response
         except Exception as e:
             print(f"API Error: {e}")
+            with self._failures_lock:
+                self.api_failures += 1
             return None
+        
+        if self.cache is not None:
+            self.cache.put("responses", key, response.model_dump(mode="json"))
+        return response
     
     def plan_execution(self, query: str) -> Dict[str, Any]:
         """
@@ -49,37 +114,7 @@ class ToolEnhancedReasoning:
         messages = [
             {
                 "role": "system",
-                "content": """You are a helpful assistant that plans how to solve problems using tools.
-
-When given a query, think through it step by step and plan which tools you need to use.
-
-IMPORTANT: You must respond in EXACTLY this format:
-
-REASONING: [Your step-by-step reasoning here]
-
-TOOLS:
-tool_name_1
-tool_name_2
-tool_name_3
-
-Available tools (use ONLY these exact names):
-- calculate_average
-- calculate_square_root
-- add_numbers
-- multiply_numbers
-- compare_numbers
-- count_vowels
-- count_letters
-- count_words
-- extract_numbers
-- compare_string_lengths
-
-Rules:
-1. List ONLY the tool names, one per line
-2. Do NOT include arguments, brackets, or extra text
-3. Do NOT include dashes or bullet points
-4. Use the exact tool names as shown above
-5. Order them in the sequence they should be executed"""
+                "content": PLANNING_PROMPT
             },
             {
                 "role": "user",
@@ -192,6 +227,116 @@ Rules:
             print(f"    Traceback: {traceback.format_exc()}")
             return error_msg
     
+    def speculate_arguments(self, tools: List[str], query: str) -> List[Optional[Any]]:
+        """
+        Issue argument-extraction calls for all planned steps concurrently.
+        
+        Each call only sees the query and the plan, so the arguments it returns
+        are a guess. The call also returns a from_query_only flag saying whether
+        the arguments come straight from the query.
+        
+        Args:
+            tools: List of planned tool names
+            query: Original query for context
+            
+        Returns:
+            List of API responses (None where a call failed), one per step
+        """
+        plan = "\n".join(f"{i+1}. {tool_name}" for i, tool_name in enumerate(tools))
+        
+        def request(step):
+            i, tool_name = step
+            messages = [
+                {
+                    "role": "system",
+                    "content": f"""You are a helpful assistant. The following tools will be called in order:
+{plan}
+
+You are providing the arguments for step {i+1} ({tool_name}) before any step has run.
+Use only numbers and text that appear literally in the user's question.
+If an argument depends on the result of an earlier step, you cannot know it yet: use null for it
+and set {FROM_QUERY_ONLY} to false. Set {FROM_QUERY_ONLY} to true only if no argument depends on an earlier step."""
+                },
+                {
+                    "role": "user",
+                    "content": query
+                }
+            ]
+            speculative_tool = get_speculative_tool(tool_name)
+            if speculative_tool is None:
+                return None
+            return self.chat_completion_request(
+                messages,
+                tools=[speculative_tool],
+                tool_choice={"type": "function", "function": {"name": tool_name}}
+            )
+        
+        if not tools:
+            return []
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            return list(executor.map(request, enumerate(tools)))
+    
+    def arguments_from_query(self, arguments: Any, query: str) -> bool:
+        """
+        Check whether speculative arguments were taken directly from the query.
+        
+        Args:
+            arguments: Parsed tool arguments (or a single argument value)
+            query: Original query
+            
+        Returns:
+            True if every value is non-empty and appears in the query: numbers
+            as numbers in the query, text as a quoted span (if the query quotes
+            any) or otherwise as whole words
+        """
+        if isinstance(arguments, dict):
+            return bool(arguments) and all(self.arguments_from_query(v, query) for v in arguments.values())
+        if isinstance(arguments, list):
+            return bool(arguments) and all(self.arguments_from_query(v, query) for v in arguments)
+        if isinstance(arguments, bool) or arguments is None:
+            return False
+        if isinstance(arguments, (int, float)):
+            return float(arguments) in self.string_tools.extract_numbers(query)
+        if isinstance(arguments, str):
+            text = arguments.strip()
+            if not text:
+                return False
+            # A ' between two word characters is an apostrophe (What's, don't), not a quote
+            quoted = re.findall(r"(?<!\w)'((?:[^']|(?<=\w)'(?=\w))+)'(?!\w)|\"([^\"]+)\"", query)
+            if quoted:
+                return text.lower() in [(single or double).lower() for single, double in quoted]
+            return re.search(r"(?<!\w)" + re.escape(text) + r"(?!\w)", query, re.IGNORECASE) is not None
+        return False
+    
+    def speculation_rejection(self, tools: List[str], step: int, arguments: Dict[str, Any], from_query_only: bool, query: str) -> Optional[str]:
+        """
+        Decide whether a step can run on its speculative arguments.
+        
+        A step with numeric arguments that follows a step returning a number may
+        consume that result, so it is re-issued unless the speculative call
+        explicitly marked its inputs as coming from the query only.
+        
+        Args:
+            tools: List of planned tool names
+            step: Index of the step in the plan
+            arguments: Speculative arguments (without the from_query_only flag)
+            from_query_only: Flag returned by the speculative call
+            query: Original query
+            
+        Returns:
+            None if the speculative arguments can be used, otherwise the reason
+            they were rejected
+        """
+        if not self.arguments_from_query(arguments, query):
+            return "not taken from the query"
+        depends_on_earlier = (
+            has_numeric_arguments(tools[step])
+            and any(tool_name in NUMERIC_RESULT_TOOLS for tool_name in tools[:step])
+        )
+        if depends_on_earlier and from_query_only is not True:
+            return "may depend on an earlier numeric result"
+        return None
+    
     def execute_tools_sequentially(self, tools: List[str], query: str) -> List[Dict[str, Any]]:
         """
         Step 2: Execute tools sequentially based on the plan.
@@ -207,11 +352,7 @@ Rules:
         messages = [
             {
                 "role": "system",
-                "content": """You are a helpful assistant. Use tools when needed to answer the user's question.
-                
-When calling a tool, provide the appropriate arguments based on the context and previous results.
-For mathematical operations, extract numbers from the query or use results from previous tools.
-For string operations, use the text specified in the query."""
+                "content": EXECUTION_PROMPT
             },
             {
                 "role": "user",
@@ -219,34 +360,61 @@ For string operations, use the text specified in the query."""
             }
         ]
         
+        # Overlap the argument calls for all steps; steps whose arguments may
+        # depend on an earlier result are re-issued below
+        if self.speculative:
+            speculative_responses = self.speculate_arguments(tools, query)
+        else:
+            speculative_responses = [None] * len(tools)
+        
         for i, tool_name in enumerate(tools):
             print(f"  Step {i+1}: Executing {tool_name}")
             
-            # Create a fresh conversation for each tool call
-            current_messages = messages.copy()
-            
-            # Add context about previous results if any
-            if results:
-                context = f"\nPrevious results: {[f'{r['tool']}: {r['result']}' for r in results]}"
-                current_messages.append({
-                    "role": "user",
-                    "content": f"Now call {tool_name}. {context}"
-                })
+            response = speculative_responses[i]
+            function_args = None
+            if response and response.choices[0].message.tool_calls:
+                try:
+                    function_args = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
+                except json.JSONDecodeError:
+                    function_args = None
+                if isinstance(function_args, dict):
+                    from_query_only = function_args.pop(FROM_QUERY_ONLY, False)
+                    rejection = self.speculation_rejection(tools, i, function_args, from_query_only, query)
+                    if rejection:
+                        print(f"    Speculative arguments {rejection}: {function_args}")
+                        function_args = None
+                else:
+                    function_args = None
             
-            # Ask LLM to call the specific tool
-            response = self.chat_completion_request(
-                current_messages, 
-                tools=get_all_tools(), 
-                tool_choice={"type": "function", "function": {"name": tool_name}}
-            )
-            
-            if not response or not response.choices[0].message.tool_calls:
-                print(f"    Failed to call {tool_name}")
-                continue
+            if function_args is None:
+                # Create a fresh conversation for each tool call
+                current_messages = messages.copy()
+                
+                # Add context about previous results if any
+                if results:
+                    context = f"\nPrevious results: {[r['tool'] + ': ' + str(r['result']) for r in results]}"
+                    current_messages.append({
+                        "role": "user",
+                        "content": f"Now call {tool_name}. {context}"
+                    })
+                
+                # Ask LLM to call the specific tool
+                response = self.chat_completion_request(
+                    current_messages, 
+                    tools=get_all_tools(), 
+                    tool_choice={"type": "function", "function": {"name": tool_name}}
+                )
+                
+                if not response or not response.choices[0].message.tool_calls:
+                    print(f"    Failed to call {tool_name}")
+                    continue
+                
+                function_args = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
+            else:
+                print("    Using speculative arguments")
             
             # Execute the tool
             tool_call = response.choices[0].message.tool_calls[0]
-            function_args = json.loads(tool_call.function.arguments)
             
             print(f"    Arguments: {function_args}")
             
@@ -285,7 +453,7 @@ For string operations, use the text specified in the query."""
         messages = [
             {
                 "role": "system",
-                "content": "You are a helpful assistant. Provide a clear final answer based on the reasoning and tool results."
+                "content": FINAL_ANSWER_PROMPT
             },
             {
                 "role": "user",
@@ -339,17 +507,56 @@ Please provide a clear final answer. If tools failed, provide the answer based o
             "final_answer": final_answer
         }
 
+def measure_startup(query: str) -> Dict[str, float]:
+    """
+    Measure cold-start cost: module import, system init and the first query.
+    
+    Args:
+        query: Query to use as the first query
+        
+    Returns:
+        Dictionary of timings in seconds
+    """
+    start = time.perf_counter()
+    reasoning_system = ToolEnhancedReasoning()
+    init_end = time.perf_counter()
+    reasoning_system.client
+    client_end = time.perf_counter()
+    reasoning_system.process_query(query)
+    query_end = time.perf_counter()
+    
+    return {
+        "import": _IMPORT_END - _IMPORT_START,
+        "init": init_end - start,
+        "client": client_end - init_end,
+        "first_query": query_end - client_end,
+        "total": query_end - _IMPORT_START
+    }
+
 def main():
     """Main function to run the tool-enhanced reasoning script."""
-    reasoning_system = ToolEnhancedReasoning()
+    import sys
     
     # Example queries for testing
     test_queries = [
         "What's the square root of the average of 18 and 50?",
         "How many vowels are in the word 'Multimodality'?",
-        "Is the number of letters in 'machine' greater than the number of vowels in 'reasoning'?"
+        "Is the number of letters in 'machine' greater than the number of vowels in 'reasoning'?",
+        "What's the number of vowels in 'banana'?"
     ]
     
+    if "--startup-time" in sys.argv[1:]:
+        timings = measure_startup(test_queries[0])
+        print(f"\nStartup timings:")
+        print(f"  Module import: {timings['import']*1000:.1f} ms")
+        print(f"  System init:   {timings['init']*1000:.1f} ms")
+        print(f"  Client import: {timings['client']*1000:.1f} ms")
+        print(f"  First query:   {timings['first_query']*1000:.1f} ms")
+        print(f"  Total:         {timings['total']*1000:.1f} ms")
+        return
+    
+    reasoning_system = ToolEnhancedReasoning()
+    
     for query in test_queries:
         print(f"\n{'='*60}")
         print(f"Query: {query}")